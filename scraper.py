@@ -1,11 +1,14 @@
-import requests
+import aiohttp
+import asyncio
 from bs4 import BeautifulSoup
-import time
+import soupsieve as sv
 import json
+import orjson
 import os
 import sqlite3
-from requests.auth import HTTPBasicAuth
-from openai import OpenAI
+import hashlib
+import atexit
+from openai import AsyncOpenAI
 
 # -----------------------
 # Configuration
@@ -19,52 +22,134 @@ HEADERS = {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64)"}
 WP_API_URL = os.environ.get("WP_API_URL")
 WP_USER = os.environ.get("WP_USER")
 WP_PASS = os.environ.get("WP_PASS")
+WP_AUTH = aiohttp.BasicAuth(WP_USER or "", WP_PASS or "")
 
 CACHE_FILE = "apply_url_cache.json"
+DB_FILE = "posted_jobs.db"
 REQUEST_TIMEOUT = 15
+MAX_CONCURRENT_JOBS = 10
+HTTP_POOL_SIZE = 32
+RETRY_TOTAL = 5
+RETRY_BACKOFF = 0.5
+RETRY_MAX_WAIT = 30
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+AI_MODEL = "gpt-4o-mini"
+
+# -----------------------
+# CSS Selectors (compiled once)
+# -----------------------
+_SEL_JOB_LINK = sv.compile("h2 a[href^='/job/']")
+_SEL_H1 = sv.compile("h1")
+_SEL_POSTED_DATE = sv.compile("#posted-date")
+_SEL_DEADLINE = sv.compile("div.read-date-sec-li:not(#posted-date)")
+_SEL_JOB_KEY = sv.compile("ul.job-key-info")
+_SEL_LI = sv.compile("li")
+_SEL_JKEY_TITLE = sv.compile("span.jkey-title")
+_SEL_JKEY_INFO = sv.compile("span.jkey-info")
+_SEL_JOB_DESC = sv.compile("li.job-description")
+_SEL_APPLY = sv.compile("a[href^='/apply-now/']")
+_SEL_A_CV = sv.compile("a[href^='/cv'], a.view-all2")
+_SEL_AD = sv.compile("#adbox, form.read-sub-form-top, #read-in-ad")
+_SEL_P = sv.compile("p")
 
 # -----------------------
 # OpenAI Setup
 # -----------------------
-client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
 
 # -----------------------
 # Database Functions
 # -----------------------
+_DB_CONN = None
+POSTED_IDS: set[str] = set()
+_PENDING_MARKS: list[str] = []
+
 def init_db():
-    conn = sqlite3.connect('posted_jobs.db')
-    c = conn.cursor()
-    c.execute('''
+    global _DB_CONN
+    _DB_CONN = sqlite3.connect(DB_FILE)
+    _DB_CONN.execute("PRAGMA journal_mode=WAL")
+    _DB_CONN.execute("PRAGMA synchronous=NORMAL")
+    _DB_CONN.execute("PRAGMA cache_size=-65536")
+    _DB_CONN.execute("PRAGMA temp_store=MEMORY")
+    row = _DB_CONN.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='posted_jobs'").fetchone()
+    if row and "WITHOUT ROWID" not in row[0].upper():
+        # One-time migration: rebuild the table so the primary key is the table itself.
+        # Explicit BEGIN: sqlite3 won't open a transaction for DDL on its own.
+        with _DB_CONN:
+            _DB_CONN.execute("BEGIN")
+            _DB_CONN.execute("ALTER TABLE posted_jobs RENAME TO posted_jobs_old")
+            _DB_CONN.execute("CREATE TABLE posted_jobs (job_id TEXT PRIMARY KEY) WITHOUT ROWID")
+            _DB_CONN.execute("INSERT OR IGNORE INTO posted_jobs (job_id) SELECT job_id FROM posted_jobs_old")
+            _DB_CONN.execute("DROP TABLE posted_jobs_old")
+    _DB_CONN.execute('''
         CREATE TABLE IF NOT EXISTS posted_jobs (
             job_id TEXT PRIMARY KEY
+        ) WITHOUT ROWID
+    ''')
+    _DB_CONN.execute('''
+        CREATE TABLE IF NOT EXISTS ai_cache (
+            key TEXT PRIMARY KEY,
+            value TEXT
         )
     ''')
-    conn.commit()
-    conn.close()
+    _DB_CONN.commit()
+    POSTED_IDS.update(row[0] for row in _DB_CONN.execute("SELECT job_id FROM posted_jobs"))
+    # atexit runs LIFO: flush any batched marks, then close
+    atexit.register(_DB_CONN.close)
+    atexit.register(flush_posted_jobs)
 
 def is_job_posted(job_id: str) -> bool:
-    conn = sqlite3.connect('posted_jobs.db')
-    c = conn.cursor()
-    c.execute("SELECT 1 FROM posted_jobs WHERE job_id=?", (job_id,))
-    exists = c.fetchone() is not None
-    conn.close()
-    return exists
+    return job_id in POSTED_IDS
 
 def mark_job_as_posted(job_id: str):
-    conn = sqlite3.connect('posted_jobs.db')
-    c = conn.cursor()
-    c.execute("INSERT OR IGNORE INTO posted_jobs (job_id) VALUES (?)", (job_id,))
-    conn.commit()
-    conn.close()
+    # Written to disk in one batch by flush_posted_jobs()
+    POSTED_IDS.add(job_id)
+    _PENDING_MARKS.append(job_id)
+
+def get_cached_ai_response(key: str):
+    row = _DB_CONN.execute("SELECT value FROM ai_cache WHERE key=?", (key,)).fetchone()
+    return row[0] if row else None
+
+def cache_ai_response(key: str, value: str):
+    _DB_CONN.execute("INSERT OR REPLACE INTO ai_cache (key, value) VALUES (?, ?)", (key, value))
+
+def flush_posted_jobs():
+    with _DB_CONN:
+        _DB_CONN.executemany("INSERT OR IGNORE INTO posted_jobs (job_id) VALUES (?)",
+                             [(job_id,) for job_id in _PENDING_MARKS])
+    _PENDING_MARKS.clear()
 
 # -----------------------
 # Helper Functions
 # -----------------------
-def get_soup(url: str) -> BeautifulSoup:
+async def retry_middleware(req: aiohttp.ClientRequest, handler: aiohttp.ClientHandlerType) -> aiohttp.ClientResponse:
+    # Session-wide retry with exponential backoff for transient errors and throttling
+    for attempt in range(RETRY_TOTAL + 1):
+        delay = RETRY_BACKOFF * 2 ** attempt
+        try:
+            resp = await handler(req)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == RETRY_TOTAL:
+                raise
+        else:
+            if resp.status not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                return resp
+            retry_after = resp.headers.get("Retry-After", "")
+            if resp.status == 429 and retry_after.isdigit():
+                # Don't stall the run if the server wants us gone for longer than we'd wait
+                if int(retry_after) > RETRY_MAX_WAIT:
+                    return resp
+                delay = int(retry_after)
+            resp.release()
+        await asyncio.sleep(delay)
+
+async def get_soup(session: aiohttp.ClientSession, url: str) -> BeautifulSoup:
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-        resp.raise_for_status()
-        return BeautifulSoup(resp.text, "html.parser")
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            content = await resp.read()
+        # Parse off the event loop so other fetches keep running meanwhile
+        return await asyncio.to_thread(BeautifulSoup, content, "lxml")
     except Exception as e:
         print(f"❌ Failed to get page {url}: {e}")
         return None
@@ -79,154 +164,143 @@ def clean_description(desc_block: BeautifulSoup) -> str:
         original_ul.decompose()
 
     # The rest of your cleaning logic
-    for a in desc_block.select("a[href^='/cv'], a.view-all2"):
+    for a in _SEL_A_CV.select(desc_block):
         if a['href'] == '/cv' and a.parent:
             a.parent.decompose()
         else:
             a.decompose()
-    for selector in ["#adbox", "form.read-sub-form-top", "#read-in-ad"]:
-        for tag in desc_block.select(selector):
-            tag.decompose()
-    for p in desc_block.select("p"):
-        if "Never pay for any CBT" in p.get_text():
-            p.decompose()
+    for tag in _SEL_AD.select(desc_block):
+        tag.decompose()
+    # Most pages lack the notice, so check the whole block once before walking paragraphs
+    if "Never pay for any CBT" in desc_block.get_text():
+        for p in _SEL_P.select(desc_block):
+            if "Never pay for any CBT" in p.get_text():
+                p.decompose()
 
     return desc_block.decode_contents(formatter="html")
 
 
-def resolve_apply_link(job_url: str) -> str:
+async def resolve_apply_link(session: aiohttp.ClientSession, job_url: str) -> str:
     try:
-        resp = requests.get(job_url, headers=HEADERS, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-        return resp.url
+        # HEAD follows the same redirects without downloading the page body
+        async with session.head(job_url, allow_redirects=True) as resp:
+            if resp.status < 400:
+                return str(resp.url)
+        # Some servers reject or mishandle HEAD; retry the chain with a GET
+        async with session.get(job_url, allow_redirects=True) as resp:
+            resp.raise_for_status()
+            return str(resp.url)
     except Exception as e:
         print(f"❌ Failed to resolve apply link for {job_url}: {e}")
-        return job_url
+        return None
 
 # -----------------------
 # AI Rewrite Functions
 # -----------------------
-def rewrite_job_title(original_title: str) -> str:
+async def rewrite_all(original_title: str, raw_html: str, field: str, qualification: str, original_excerpt: str) -> dict:
+    # One request for all four rewrites, so they share a single round trip and prompt prefix
+    fallback = {"title": original_title, "description": raw_html, "tips": "", "excerpt": original_excerpt}
     try:
         prompt = f"""
-Rewrite this job title for SEO without changing its core meaning.
+You are preparing a job posting. Produce four outputs and return them as a JSON object
+with exactly these keys: "title", "description", "tips", "excerpt".
 
+1. title - Rewrite this job title for SEO without changing its core meaning.
 Original Title: {original_title}
-
 - Keep the structure similar to a standard job posting.
 - Do NOT add any marketing phrases like 'Join Our Team!', 'Apply Now!', 'Exciting Opportunity,' 'Urgent Hire,' 'We're Hiring,' or similar words in parentheses.
 - Keep it concise and professional.
-- The output should be the clean title, nothing more.
-"""
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            timeout=20
-        )
-        new_title = resp.choices[0].message.content.strip()
-        unwanted_phrases = ["(Join Our Team!)", "(Exciting Opportunity)", "(Urgent Hire)", "(Apply Now!)"]
-        for phrase in unwanted_phrases:
-            new_title = new_title.replace(phrase, "").strip()
-        return new_title.strip(" -")
-    except Exception as e:
-        print(f"⚠️ Title rewrite failed: {e}")
-        return original_title
+- The value should be the clean title, nothing more.
 
-def rewrite_job_description(raw_html: str) -> str:
-    try:
-        prompt = f"""
-Rewrite the following job description professionally and clearly.
+2. description - Rewrite the following job description professionally and clearly.
 - Preserve all HTML tags: <p>, <b>, <ul>, <li>.
 - Keep Job Type, Qualification, Experience, Location, Job Field, Posted/Deadline unchanged.
 - Improve clarity, readability, and SEO.
 - Do not add markdown, asterisks, or extra labels.
-
 Job Description:
 {raw_html}
-"""
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            timeout=30
-        )
-        rewritten_html = resp.choices[0].message.content.strip()
-        return rewritten_html
-    except Exception as e:
-        print(f"⚠️ Description rewrite failed: {e}")
-        return raw_html
-
-def generate_standout_tips(job_title: str, field: str, qualification: str) -> str:
-    try:
-        prompt = f"""
-Generate 3-5 short, practical tips for applicants on how to stand out when applying for this job:
 
-Job Title: {job_title}
+3. tips - Generate 3-5 short, practical tips for applicants on how to stand out when applying for this job.
+Job Title: {original_title}
 Field: {field}
 Qualification: {qualification}
-
 - Write in HTML <ul><li> format.
 - Keep each tip clear and professional.
 - Do not include introductions or conclusions, just the list.
-"""
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            timeout=20
-        )
-        return resp.choices[0].message.content.strip()
-    except Exception as e:
-        print(f"⚠️ Standout tips generation failed: {e}")
-        return ""
 
-def rewrite_excerpt(original_excerpt: str) -> str:
-    try:
-        prompt = f"""
-Write a concise, factual, and SEO-friendly meta description (under 160 characters) for this job.
+4. excerpt - Write a concise, factual, and SEO-friendly meta description (under 160 characters) for this job.
 The description should clearly state the company, job title, and location.
-
 Original Excerpt: {original_excerpt}
-
 - Do NOT use marketing phrases like 'Join us,' 'Kickstart your career,' 'Exciting opportunity,' or calls to action like 'Apply today!'
-- The output should be a simple, factual statement that a search engine can use.
+- The value should be a simple, factual statement that a search engine can use.
 """
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            timeout=20
-        )
-        new_excerpt = resp.choices[0].message.content.strip()
-        return new_excerpt
+        # Identical inputs (e.g. on a re-run) reuse the stored response
+        cache_key = hashlib.sha256(f"{AI_MODEL}|{prompt}".encode()).hexdigest()
+        content = get_cached_ai_response(cache_key)
+        cached = content is not None
+        if not cached:
+            resp = await client.chat.completions.create(
+                model=AI_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"},
+                temperature=0.7,
+                timeout=60
+            )
+            content = resp.choices[0].message.content
+        data = json.loads(content)
+        if not isinstance(data, dict):
+            raise ValueError("response is not a JSON object")
+        if not cached:
+            cache_ai_response(cache_key, content)
     except Exception as e:
-        print(f"⚠️ Excerpt rewrite failed: {e}")
-        return original_excerpt
+        print(f"⚠️ AI rewrite failed: {e}")
+        return fallback
+
+    result = {}
+    for key, default in fallback.items():
+        value = data.get(key)
+        result[key] = value.strip() if isinstance(value, str) and value.strip() else default
+
+    unwanted_phrases = ["(Join Our Team!)", "(Exciting Opportunity)", "(Urgent Hire)", "(Apply Now!)"]
+    for phrase in unwanted_phrases:
+        result["title"] = result["title"].replace(phrase, "").strip()
+    result["title"] = result["title"].strip(" -")
+    return result
 
 # -----------------------
 # URL Slug Generator
 # -----------------------
+_SLUG_TABLE = str.maketrans({" ": "-", "/": "-", ",": None, ".": None})
+
 def slugify(text: str) -> str:
-    return text.replace(" ", "-").replace("/", "-").replace(",", "").replace(".", "").lower()
+    return text.translate(_SLUG_TABLE).lower()
 
 # -----------------------
 # Parse Job
 # -----------------------
-def parse_job(job_url: str) -> dict:
-    soup = get_soup(job_url)
+async def parse_job(session: aiohttp.ClientSession, job_url: str, cache: dict) -> dict:
+    soup = await get_soup(session, job_url)
     if not soup:
         return None, None, None
 
+    # Apply link carries the authoritative job ID; check it before any AI work
+    apply_tag = _SEL_APPLY.select_one(soup)
+    if not apply_tag:
+        return None, None, None
+    job_id = apply_tag["href"].split("/")[-1]
+    if is_job_posted(job_id):
+        return None, job_id, None
+    apply_url = BASE_URL + apply_tag["href"]
+
     job_data = {"url": job_url}
 
     # Title
-    title_tag = soup.select_one("h1")
+    title_tag = _SEL_H1.select_one(soup)
     original_title = title_tag.get_text(strip=True) if title_tag else "Untitled Job"
-    job_data["title"] = rewrite_job_title(original_title)
 
     # Dates
-    posted_date_tag = soup.select_one("#posted-date")
-    deadline_tag = soup.select_one("div.read-date-sec-li:not(#posted-date)")
+    posted_date_tag = _SEL_POSTED_DATE.select_one(soup)
+    deadline_tag = _SEL_DEADLINE.select_one(soup)
     job_data["posted_date"] = (
         posted_date_tag.get_text(strip=True).replace("Posted:", "").strip()
         if posted_date_tag else "Not specified"
@@ -237,46 +311,47 @@ def parse_job(job_url: str) -> dict:
     )
 
     # Job Key Info - Find the original ul for data extraction
-    job_key_ul = soup.select_one("ul.job-key-info")
+    job_key_ul = _SEL_JOB_KEY.select_one(soup)
     job_info = {}
     job_key_ul_content = ""
     
     if job_key_ul:
-        for li in job_key_ul.select("li"):
-            key_tag = li.select_one("span.jkey-title")
-            value_span = li.select_one("span.jkey-info")
+        for li in _SEL_LI.select(job_key_ul):
+            key_tag = _SEL_JKEY_TITLE.select_one(li)
+            value_span = _SEL_JKEY_INFO.select_one(li)
             if key_tag and value_span:
                 key = key_tag.get_text(strip=True).rstrip(":")
                 val_text = value_span.get_text(strip=True)
                 job_info[key] = val_text
         
         # Now, create a new HTML string for the job info list with dynamic links
-        job_key_ul_content = "<ul>"
+        ul_parts = ["<ul>"]
         for key, val in job_info.items():
-            job_key_ul_content += f"<li><span class='jkey-title'>{key}:</span> "
+            ul_parts.append(f"<li><span class='jkey-title'>{key}:</span> ")
             if key == "Job Type":
                 link_slug = slugify(val)
-                job_key_ul_content += f"<a href='{BASE_URL}/jobs-by-type/{link_slug}'>{val}</a>"
+                ul_parts.append(f"<a href='{BASE_URL}/jobs-by-type/{link_slug}'>{val}</a>")
             elif key == "Location":
                 link_slug = slugify(val)
-                job_key_ul_content += f"<a href='{BASE_URL}/jobs-location/{link_slug}'>{val}</a>"
+                ul_parts.append(f"<a href='{BASE_URL}/jobs-location/{link_slug}'>{val}</a>")
             elif key == "Job Field":
                 fields = [f.strip() for f in val.split("/")]
                 links = [f"<a href='{BASE_URL}/jobs-by-field/{slugify(f)}'>{f}</a>" for f in fields]
-                job_key_ul_content += " / ".join(links)
+                ul_parts.append(" / ".join(links))
             elif key == "Qualification":
                 link_slug = slugify(val)
-                job_key_ul_content += f"<a href='{BASE_URL}/jobs-by-education/{link_slug}'>{val}</a>"
+                ul_parts.append(f"<a href='{BASE_URL}/jobs-by-education/{link_slug}'>{val}</a>")
             elif key == "Experience":
                 link_slug = slugify(val)
-                job_key_ul_content += f"<a href='{BASE_URL}/jobs-by-experience/{link_slug}'>{val}</a>"
+                ul_parts.append(f"<a href='{BASE_URL}/jobs-by-experience/{link_slug}'>{val}</a>")
             else:
-                job_key_ul_content += val
-            job_key_ul_content += "</li>"
-        job_key_ul_content += "</ul>"
+                ul_parts.append(val)
+            ul_parts.append("</li>")
+        ul_parts.append("</ul>")
+        job_key_ul_content = "".join(ul_parts)
 
     # Job Description
-    desc_block = soup.select_one("li.job-description")
+    desc_block = _SEL_JOB_DESC.select_one(soup)
     
     # Extract the first paragraph as the company overview
     company_desc_with_title = ""
@@ -294,15 +369,6 @@ def parse_job(job_url: str) -> dict:
     
     # Combine all parts in the correct order
     full_description = f"{description_with_dates}{job_key_ul_content}{company_desc_with_title}{job_description}"
-    job_data["description"] = rewrite_job_description(full_description)
-    
-    # Generate "How to Stand Out" section
-    job_title = job_data["title"]
-    field = job_info.get("Job Field", "")
-    qualification = job_info.get("Qualification", "")
-    standout_tips = generate_standout_tips(job_title, field, qualification)
-    if standout_tips:
-        job_data["description"] += "<h2>How to Stand Out for This Job</h2>" + standout_tips
 
     # Generate Categories and Tags (for API payload, not internal HTML)
     categories = []
@@ -351,45 +417,66 @@ def parse_job(job_url: str) -> dict:
         job_title_for_excerpt = original_title
     
     original_excerpt = f"{company} is hiring a {job_title_for_excerpt} in {location}."
-    job_data["excerpt"] = rewrite_excerpt(original_excerpt)
 
-    # Apply link
-    apply_tag = soup.select_one("a[href^='/apply-now/']")
-    if apply_tag:
-        apply_url = BASE_URL + apply_tag["href"]
-        resolved_url = resolve_apply_link(apply_url)
-        job_data["apply_url"] = resolved_url
-        job_id = apply_tag["href"].split("/")[-1]
-        return job_data, job_id, resolved_url
+    rewritten = await rewrite_all(original_title, full_description, job_field, qualification, original_excerpt)
+    job_data["title"] = rewritten["title"]
+    job_data["description"] = rewritten["description"]
+    job_data["excerpt"] = rewritten["excerpt"]
+    standout_tips = rewritten["tips"]
 
-    return job_data, None, None
+    # Generate "How to Stand Out" section
+    if standout_tips:
+        job_data["description"] += "<h2>How to Stand Out for This Job</h2>" + standout_tips
+
+    # Apply link
+    resolved_url = cache.get(job_id)
+    # Older runs cached the unresolved apply-now URL on failure; resolve those again
+    if not resolved_url or resolved_url == apply_url:
+        resolved_url = await resolve_apply_link(session, apply_url)
+    job_data["apply_url"] = resolved_url or apply_url
+    # Only a real resolution is returned for caching
+    if resolved_url == apply_url:
+        resolved_url = None
+    return job_data, job_id, resolved_url
 
 # -----------------------
 # WordPress Helper
 # -----------------------
-def get_wp_term_id(name: str, taxonomy: str):
+_TERM_CACHE: dict[tuple[str, str], int] = {}
+
+async def get_wp_term_id(session: aiohttp.ClientSession, name: str, taxonomy: str):
+    key = (taxonomy, name.lower())
+    if key in _TERM_CACHE:
+        return _TERM_CACHE[key]
     try:
-        url = f"https://opportunee.com/wp-json/wp/v2/{taxonomy}?search={name}"
-        resp = requests.get(url, auth=HTTPBasicAuth(WP_USER, WP_PASS), timeout=REQUEST_TIMEOUT)
-        if resp.status_code == 200:
-            for term in resp.json():
-                if term.get("name").lower() == name.lower():
-                    return term.get("id")
-        create_resp = requests.post(f"https://opportunee.com/wp-json/wp/v2/{taxonomy}",
-                                     auth=HTTPBasicAuth(WP_USER, WP_PASS),
-                                     json={"name": name},
-                                     timeout=REQUEST_TIMEOUT)
-        if create_resp.status_code in [200, 201]:
-            return create_resp.json().get("id")
-        return None
+        url = f"https://opportunee.com/wp-json/wp/v2/{taxonomy}"
+        term_id = None
+        # Create directly; WordPress reports an existing term's id in the term_exists error
+        async with session.post(url, auth=WP_AUTH, json={"name": name}) as create_resp:
+            body = await create_resp.json()
+            if create_resp.status in [200, 201]:
+                term_id = body.get("id")
+            elif create_resp.status == 400 and body.get("code") == "term_exists":
+                term_id = body.get("data", {}).get("term_id")
+            else:
+                print(f"❌ Failed to get {taxonomy} '{name}': {create_resp.status} {body}")
+        if term_id:
+            _TERM_CACHE[key] = term_id
+        return term_id
     except Exception as e:
         print(f"❌ Exception while handling {taxonomy} '{name}': {e}")
         return None
 
-def post_to_wordpress(job: dict) -> bool:
+async def post_to_wordpress(session: aiohttp.ClientSession, job: dict) -> bool:
     try:
-        category_ids = [get_wp_term_id(c, "categories") for c in job.get("categories", []) if c.strip()]
-        tag_ids = [get_wp_term_id(t, "tags") for t in job.get("tags", []) if t.strip()]
+        categories = [c for c in job.get("categories", []) if c.strip()]
+        tags = [t for t in job.get("tags", []) if t.strip()]
+        term_ids = await asyncio.gather(
+            *(get_wp_term_id(session, c, "categories") for c in categories),
+            *(get_wp_term_id(session, t, "tags") for t in tags),
+        )
+        category_ids = term_ids[:len(categories)]
+        tag_ids = term_ids[len(categories):]
         
         payload = {
             "title": job["title"],
@@ -399,13 +486,12 @@ def post_to_wordpress(job: dict) -> bool:
             "categories": [c_id for c_id in category_ids if c_id],
             "tags": [t_id for t_id in tag_ids if t_id],
         }
-        response = requests.post(WP_API_URL, auth=HTTPBasicAuth(WP_USER, WP_PASS),
-                                 json=payload, timeout=REQUEST_TIMEOUT)
-        if response.status_code == 201:
-            print(f"✅ Posted with categories: {job['categories']} and tags: {job['tags']}")
-            return True
-        print(f"❌ Failed to post {job['title']}: {response.status_code} {response.text}")
-        return False
+        async with session.post(WP_API_URL, auth=WP_AUTH, json=payload) as response:
+            if response.status == 201:
+                print(f"✅ Posted with categories: {job['categories']} and tags: {job['tags']}")
+                return True
+            print(f"❌ Failed to post {job['title']}: {response.status} {await response.text()}")
+            return False
     except Exception as e:
         print(f"❌ Exception posting job {job['title']}: {e}")
         return False
@@ -413,61 +499,104 @@ def post_to_wordpress(job: dict) -> bool:
 # -----------------------
 # Main Scraper
 # -----------------------
-if __name__ == "__main__":
+_IN_FLIGHT_IDS: set[str] = set()
+
+async def scrape_job(session: aiohttp.ClientSession, link: str, job_slug: str, cache: dict):
+    # Returns True/False for posted/failed, None when skipped as already posted
+    job_data, job_id, resolved_url = await parse_job(session, link, cache)
+
+    if not job_id:
+        print(f"❌ Failed to get job ID for {link}. Skipping.")
+        return False
+
+    if is_job_posted(job_id) or job_id in _IN_FLIGHT_IDS:
+        print(f"   → Job ID {job_id} already posted. Skipping.")
+        if job_slug != job_id and is_job_posted(job_id):
+            mark_job_as_posted(job_slug) # Jobs posted before slugs were recorded
+        return None
+
+    if not job_data:
+        print(f"❌ Failed to parse job {link}")
+        return False
+
+    if job_id and resolved_url:
+        cache[job_id] = resolved_url
+
+    # Reserve the id before awaiting so a concurrent duplicate can't post it too
+    _IN_FLIGHT_IDS.add(job_id)
+    try:
+        if not await post_to_wordpress(session, job_data):
+            return False
+        mark_job_as_posted(job_id) # Mark as posted on success
+        if job_slug != job_id:
+            mark_job_as_posted(job_slug) # Lets the pre-filter catch it next run
+        return True
+    finally:
+        _IN_FLIGHT_IDS.discard(job_id)
+
+async def main():
     all_success = 0
     all_failed = 0
     page = 1
     cache = {}
+    if os.path.exists(CACHE_FILE):
+        with open(CACHE_FILE, "rb") as f:
+            cache = orjson.loads(f.read())
     init_db()  # Initialize the database here
 
-    while True:
-        url = f"{BASE_URL}/jobs-by-date/today/{page}" if page > 1 else START_URL
-        print(f"\n🔎 Scraping Page {page}: {url}")
-        soup = get_soup(url)
-        if not soup:
-            print(f"❌ Skipping page {page} due to load failure.")
-            break
-
-        job_links = [BASE_URL + a["href"] for a in soup.select("h2 a[href^='/job/']")]
-        if not job_links:
-            print("📌 No more jobs found. Ending scraping.")
-            break
-
-        print(f"📄 Found {len(job_links)} jobs on this page.")
-
-        for idx, link in enumerate(job_links, 1):
-            print(f"   → Scraping Job {idx}/{len(job_links)}: {link}")
-            job_data, job_id, resolved_url = parse_job(link)
-            
-            if not job_id:
-                print(f"❌ Failed to get job ID for {link}. Skipping.")
-                all_failed += 1
-                continue
-
-            if is_job_posted(job_id):
-                print(f"   → Job ID {job_id} already posted. Skipping.")
-                continue
-
-            if not job_data:
-                print(f"❌ Failed to parse job {link}")
-                all_failed += 1
-                continue
-
-            if job_id and resolved_url:
-                cache[job_id] = resolved_url
-
-            if post_to_wordpress(job_data):
-                all_success += 1
-                mark_job_as_posted(job_id) # Mark as posted on success
-            else:
-                all_failed += 1
-
-        page += 1
-        time.sleep(2)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+    timeout = aiohttp.ClientTimeout(sock_connect=REQUEST_TIMEOUT, sock_read=REQUEST_TIMEOUT)
+
+    # One pooled keep-alive connector for every host, so TLS handshakes are reused
+    connector = aiohttp.TCPConnector(limit=HTTP_POOL_SIZE, limit_per_host=HTTP_POOL_SIZE, ttl_dns_cache=300)
+
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout, connector=connector,
+                                     middlewares=(retry_middleware,)) as session:
+
+        async def run_job(idx: int, total: int, link: str, job_slug: str):
+            async with semaphore:
+                print(f"   → Scraping Job {idx}/{total}: {link}")
+                return await scrape_job(session, link, job_slug, cache)
+
+        while True:
+            url = f"{BASE_URL}/jobs-by-date/today/{page}" if page > 1 else START_URL
+            print(f"\n🔎 Scraping Page {page}: {url}")
+            soup = await get_soup(session, url)
+            if not soup:
+                print(f"❌ Skipping page {page} due to load failure.")
+                break
+
+            # Listings can repeat a job; dedupe so concurrent tasks don't race on it
+            job_links = list(dict.fromkeys(BASE_URL + a["href"] for a in _SEL_JOB_LINK.select(soup)))
+            if not job_links:
+                print("📌 No more jobs found. Ending scraping.")
+                break
+
+            print(f"📄 Found {len(job_links)} jobs on this page.")
+
+            tasks = []
+            for idx, link in enumerate(job_links, 1):
+                # Cheap pre-filter on the listing slug before any fetch or AI work
+                job_slug = link.rsplit("/", 1)[-1]
+                if is_job_posted(job_slug):
+                    print(f"   → Job {job_slug} already posted. Skipping.")
+                    continue
+                tasks.append(run_job(idx, len(job_links), link, job_slug))
+
+            results = await asyncio.gather(*tasks)
+            all_success += results.count(True)
+            all_failed += results.count(False)
+
+            flush_posted_jobs()  # Persist this page's marks in one transaction
+            page += 1
+            await asyncio.sleep(2)
 
     if cache:
-        with open(CACHE_FILE, "w") as f:
-            json.dump(cache, f, indent=2)
+        with open(CACHE_FILE, "wb") as f:
+            f.write(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
         print(f"\n💾 Updated apply URL cache: {CACHE_FILE}")
 
-    print(f"\n📌 Scraping & Posting Complete: ✅ {all_success} jobs, ⚠️ {all_failed} failed.")
\ No newline at end of file
+    print(f"\n📌 Scraping & Posting Complete: ✅ {all_success} jobs, ⚠️ {all_failed} failed.")
+
+if __name__ == "__main__":
+    asyncio.run(main())